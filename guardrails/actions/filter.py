@@ -1,38 +1,63 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Union
+
+from guardrails.actions.refrain import Refrain
 
 
 class Filter:
     pass
 
 
-def apply_filters(value: Any) -> Any:
-    """Recursively filter out any values that are instances of Filter."""
+def _filter(value: Any, stop_on_refrain: bool) -> Tuple[bool, Any]:
     if isinstance(value, Filter):
-        pass
-    elif isinstance(value, List):
-        # Cleaner syntax but requires two iterations
-        # filtered_list = list(filter(None, map(apply_filters, value)))
-        filtered_list = []
-        for item in value:
-            filtered_item = apply_filters(item)
-            if filtered_item is not None:
-                filtered_list.append(filtered_item)
-
-        return filtered_list
-    elif isinstance(value, Dict):
-        # Cleaner syntax but requires two iterations
-        # filtered_dict = {
-        #     k: apply_filters(v)
-        #     for k, v in value.items()
-        #     if apply_filters(v)
-        # }
-        filtered_dict = {}
-        for k, v in value.items():
+        return False, None
+    if isinstance(value, Refrain) and stop_on_refrain:
+        return True, None
+    if not isinstance(value, (list, dict)):
+        return False, value
+
+    # Walk the structure with an explicit stack instead of recursing;
+    # each entry pairs a source container with the copy being filled in.
+    filtered_root: Union[List, Dict] = [] if isinstance(value, list) else {}
+    stack: List[Tuple[Union[List, Dict], Union[List, Dict]]] = [(value, filtered_root)]
+    while stack:
+        source, filtered = stack.pop()
+        is_dict = isinstance(filtered, dict)
+        items = source.items() if is_dict else enumerate(source)
+        for k, child in items:
             # Should we omit the key or just the value?
-            filtered_value = apply_filters(v)
-            if filtered_value is not None:
-                filtered_dict[k] = filtered_value
+            if child is None or isinstance(child, Filter):
+                continue
+            if isinstance(child, Refrain) and stop_on_refrain:
+                return True, None
+            if isinstance(child, list):
+                filtered_child = []
+                stack.append((child, filtered_child))
+            elif isinstance(child, dict):
+                filtered_child = {}
+                stack.append((child, filtered_child))
+            else:
+                filtered_child = child
+
+            if is_dict:
+                filtered[k] = filtered_child
+            else:
+                filtered.append(filtered_child)
+
+    return False, filtered_root
+
+
+def apply_filters(value: Any) -> Any:
+    """Recursively filter out any values that are instances of Filter."""
+    return _filter(value, stop_on_refrain=False)[1]
+
+
+def filter_and_check_refrain(value: Any) -> Tuple[bool, Any]:
+    """Filters `value` like apply_filters() while checking for Refrain in
+    the same pass.
 
-        return filtered_dict
-    else:
-        return value
+    Returns:
+        Tuple[bool, Any]: Whether a Refrain was found, and the filtered
+            value. The walk stops at the first Refrain, in which case the
+            filtered value is None.
+    """
+    return _filter(value, stop_on_refrain=True)
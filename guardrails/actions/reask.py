@@ -185,7 +185,7 @@ def prune_obj_for_reasking(obj: Any) -> Union[None, Dict, List, ReAsk]:
             pruned_output = prune_obj_for_reasking(item)
             if pruned_output is not None:
                 pruned_list.append(pruned_output)
-        if len(pruned_list):
+        if pruned_list:
             return pruned_list
         return None
     elif isinstance(obj, dict):
@@ -203,10 +203,10 @@ def prune_obj_for_reasking(obj: Any) -> Union[None, Dict, List, ReAsk]:
                     pruned_output = prune_obj_for_reasking(item)
                     if pruned_output is not None:
                         pruned_list.append(pruned_output)
-                if len(pruned_list):
+                if pruned_list:
                     pruned_json[key] = pruned_list
 
-        if len(pruned_json):
+        if pruned_json:
             return pruned_json
 
         return None
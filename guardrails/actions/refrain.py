@@ -8,36 +8,40 @@ class Refrain:
 
 
 def check_for_refrain(value: Union[List, Dict]) -> bool:
-    if isinstance(value, Refrain):
-        return True
-    elif isinstance(value, list):
-        for item in value:
-            if check_for_refrain(item):
-                return True
-    elif isinstance(value, dict):
-        for key, child in value.items():
-            if check_for_refrain(child):
-                return True
+    # Iterative walk so deeply nested outputs can't hit the recursion limit
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Refrain):
+            return True
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            stack.extend(node.values())
 
     return False
 
 
+def get_refrain_value(output_type: OutputTypes) -> Any:
+    """The empty value returned in place of an output containing a
+    Refrain."""
+    if output_type == OutputTypes.STRING:
+        return ""
+    elif output_type == OutputTypes.LIST:
+        return []
+    return {}
+
+
 # Could be a generic instead of Any
 def apply_refrain(value: Any, output_type: OutputTypes) -> Any:
     """Recursively check for any values that are instances of Refrain.
 
     If found, return an empty value of the appropriate type.
     """
-    refrain_value = {}
-    if output_type == OutputTypes.STRING:
-        refrain_value = ""
-    elif output_type == OutputTypes.LIST:
-        refrain_value = []
-
     if check_for_refrain(value):
         # If the data contains a `Refain` value, we return an empty
         # value.
         logger.debug("Refrain detected.")
-        value = refrain_value
+        value = get_refrain_value(output_type)
 
     return value
@@ -68,6 +68,24 @@ class Inputs(IInputs, ArbitraryModel):
         default=False,
     )
 
+    @classmethod
+    def construct_trusted(cls, **kwargs) -> "Inputs":
+        """Builds Inputs from values the caller has already type checked.
+
+        Skips pydantic validation on every step of the validation loop.
+        `messages`, `prompt_params` and `metadata` are still shallow
+        copied, like validation would, so later updates to the runner's
+        copies don't rewrite the history. Use the regular constructor for
+        untrusted data.
+        """
+        for key in ("prompt_params", "metadata"):
+            if kwargs.get(key) is not None:
+                kwargs[key] = dict(kwargs[key])
+        messages = kwargs.get("messages")
+        if isinstance(messages, list):
+            kwargs["messages"] = [dict(message) for message in messages]
+        return cls.model_construct(**kwargs)
+
     def to_interface(self) -> IInputs:
         serialized_messages = None
         if self.messages:
@@ -3,6 +3,7 @@ import json
 import os
 from builtins import id as object_id
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -18,7 +19,6 @@ from typing import (
 )
 from typing_extensions import deprecated
 import warnings
-from langchain_core.runnables import Runnable
 
 from guardrails_api_client import (
     Guard as IGuard,
@@ -98,6 +98,9 @@ from guardrails.utils.structured_data_utils import (
 from guardrails.settings import settings
 from guardrails.decorators.experimental import experimental
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 
 class Guard(IGuard, Generic[OT]):
     """The Guard class.
@@ -1258,7 +1261,7 @@ class Guard(IGuard, Generic[OT]):
                 self._api_client = GuardrailsApiClient(api_key=api_key)
             self.upsert_guard()
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         """Convert a Guard to a LangChain Runnable."""
         from guardrails.integrations.langchain.guard_runnable import GuardRunnable
 
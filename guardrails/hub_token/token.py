@@ -1,6 +1,8 @@
 import os
+import time
+from functools import lru_cache
 import jwt
-from jwt import ExpiredSignatureError, DecodeError
+from jwt import DecodeError
 from typing import Optional
 
 from guardrails.classes.rc import RC
@@ -37,15 +39,36 @@ VALIDATOR_HUB_SERVICE = os.getenv(
 )
 
 
+@lru_cache(maxsize=8)
+def _get_token_expiration(token: str) -> Optional[int]:
+    """Decodes the token once and returns its exp claim, if any.
+
+    Expiration itself is checked against the current time on every
+    call to get_jwt_token, so caching this doesn't keep stale tokens
+    alive in long-running processes.
+    """
+    try:
+        claims = jwt.decode(
+            token, options={"verify_signature": False, "verify_exp": False}
+        )
+    except DecodeError:
+        raise InvalidTokenError(TOKEN_INVALID_MESSAGE)
+
+    exp = claims.get("exp")
+    if exp is None:
+        return None
+    try:
+        return int(exp)
+    except (TypeError, ValueError):
+        raise InvalidTokenError(TOKEN_INVALID_MESSAGE)
+
+
 def get_jwt_token(rc: RC) -> Optional[str]:
     token = rc.token
 
     # check for jwt expiration
     if token:
-        try:
-            jwt.decode(token, options={"verify_signature": False, "verify_exp": True})
-        except ExpiredSignatureError:
+        expiration = _get_token_expiration(token)
+        if expiration is not None and expiration <= time.time():
             raise ExpiredTokenError(TOKEN_EXPIRED_MESSAGE)
-        except DecodeError:
-            raise InvalidTokenError(TOKEN_INVALID_MESSAGE)
     return token
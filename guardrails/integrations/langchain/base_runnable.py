@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Dict, Optional, cast
 import json
 from langchain_core.messages import BaseMessage
@@ -29,8 +28,14 @@ class BaseRunnable(Runnable):
             validated_output = json.dumps(validated_output)
 
         if isinstance(input, BaseMessage):
-            output = deepcopy(input)
-            output.content = validated_output
+            # Only the content changes, so a shallow copy is enough.
+            # langchain-core < 0.3 messages are pydantic v1 models
+            # and don't have model_copy.
+            update = {"content": validated_output}
+            if hasattr(input, "model_copy"):
+                output = input.model_copy(update=update)
+            else:
+                output = input.copy(update=update)
             return cast(InputType, output)
 
         return cast(InputType, validated_output)
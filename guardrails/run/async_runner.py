@@ -140,7 +140,7 @@ class AsyncRunner(Runner):
     ) -> Iteration:
         """Run a full step."""
         prompt_params = prompt_params or {}
-        inputs = Inputs(
+        inputs = Inputs.construct_trusted(
             llm_api=api,
             llm_output=output,
             messages=messages,
@@ -72,7 +72,7 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         output: Optional[str] = None,
     ) -> AsyncIterator[ValidationOutcome]:
         prompt_params = prompt_params or {}
-        inputs = Inputs(
+        inputs = Inputs.construct_trusted(
             llm_api=api,
             llm_output=output,
             messages=messages,
@@ -215,7 +215,7 @@ class Runner:
     ) -> Iteration:
         """Run a full step."""
         prompt_params = prompt_params or {}
-        inputs = Inputs(
+        inputs = Inputs.construct_trusted(
             llm_api=api,
             llm_output=output,
             messages=messages,
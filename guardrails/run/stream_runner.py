@@ -74,7 +74,7 @@ class StreamRunner(Runner):
         output: Optional[str] = None,
     ) -> Iterator[ValidationOutcome[OT]]:
         """Run a full step."""
-        inputs = Inputs(
+        inputs = Inputs.construct_trusted(
             llm_api=api,
             llm_output=output,
             messages=messages,
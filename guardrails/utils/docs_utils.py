@@ -1,4 +1,5 @@
 import typing as t
+from functools import lru_cache
 
 from guardrails.prompt import Prompt, Instructions
 
@@ -9,17 +10,26 @@ try:
 except ImportError:
     tiktoken = None
 
-try:
-    import nltk  # type: ignore
-except ImportError:
-    nltk = None
 
-if nltk is not None:
+@lru_cache(maxsize=None)
+def _import_nltk():
+    """Imports nltk on first use, downloading the punkt tokenizer if it's not
+    already downloaded."""
+    try:
+        import nltk  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "nltk is required for sentence splitting. Please install it using "
+            "`poetry add nltk`"
+        )
+
     try:
         nltk.data.find("tokenizers/punkt")
     except LookupError:
         nltk.download("punkt")
 
+    return nltk
+
 
 def messages_to_prompt_string(
     messages: t.Union[
@@ -89,23 +99,7 @@ class TextSplitter:
 
 def sentence_split(text: str) -> t.List[str]:
     """Split the text into sentences."""
-    try:
-        from nltk import sent_tokenize  # type: ignore
-    except ImportError:
-        raise ImportError(
-            "nltk is required for sentence splitting. Please install it using "
-            "`poetry add nltk`"
-        )
-
-    # Download the nltk punkt tokenizer if it's not already downloaded.
-    import nltk  # type: ignore
-
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt")
-
-    return sent_tokenize(text)
+    return _import_nltk().sent_tokenize(text)
 
 
 def read_pdf(path) -> str:
@@ -140,23 +134,15 @@ def get_chunks_from_text(
             between chunks.
     """
 
-    nltk_error = (
-        "nltk is required for sentence splitting. Please install it using "
-        "`poetry add nltk`"
-    )
     tiktoken_error = (
         "tiktoken is required for token splitting. Please install it using "
         "`poetry add tiktoken`"
     )
 
     if chunk_strategy == "sentence":
-        if nltk is None:
-            raise ImportError(nltk_error)
-        atomic_chunks = nltk.sent_tokenize(text)
+        atomic_chunks = _import_nltk().sent_tokenize(text)
     elif chunk_strategy == "word":
-        if nltk is None:
-            raise ImportError(nltk_error)
-        atomic_chunks = nltk.word_tokenize(text)
+        atomic_chunks = _import_nltk().word_tokenize(text)
     elif chunk_strategy == "char":
         atomic_chunks = list(text)
     elif chunk_strategy == "token":
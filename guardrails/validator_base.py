@@ -5,21 +5,30 @@
 
 import asyncio
 import contextlib
-from functools import partial
+from functools import lru_cache, partial
 import inspect
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
 import re
-from string import Template
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing_extensions import deprecated
 from warnings import warn
 import warnings
 
-import requests
-from langchain_core.runnables import Runnable
-
 from guardrails.settings import settings
 from guardrails.classes import ErrorSpan  # noqa
 from guardrails.classes import PassResult  # noqa
@@ -36,14 +45,28 @@ from guardrails.utils.tokenization_utils import (
     postproc_splits,
 )
 
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    from langchain_core.runnables import Runnable
+
+
+# (connect, read) timeout for hub inference requests, in seconds.
+# The read timeout is left unbounded since hosted models may be cold-starting.
+HUB_INFERENCE_TIMEOUT = (3.05, None)
+
+# Compiled once at import; the chunking functions run on every streamed token.
+_POTENTIAL_LINE_ENDING_RE = re.compile(r"([?!.])(?=\s|$)")
+_SENTENCE_END_CHAR_RE = re.compile(r"[?!.]")
+
 
 ### functions to get chunks ###
 def split_sentence_str(chunk: str):
     """A naive sentence splitter that splits on periods."""
-    if "." not in chunk:
+    idx = chunk.find(".")
+    if idx < 0:
         return []
-    fragments = chunk.split(".")
-    return [fragments[0] + ".", ".".join(fragments[1:])]
+    return [chunk[: idx + 1], chunk[idx + 1 :]]
 
 
 def split_sentence_word_tokenizers_jl_separator(
@@ -73,8 +96,8 @@ def split_sentence_word_tokenizers_jl_separator(
         is_minimum_length = True
 
     # check for potential line endings, which is what split_sentences does
-    chunk_with_potential_line_endings, count = re.subn(
-        r"([?!.])(?=\s|$)", rf"\1{separator}", chunk
+    chunk_with_potential_line_endings, count = _POTENTIAL_LINE_ENDING_RE.subn(
+        rf"\1{separator}", chunk
     )
     any_potential_line_endings = count > 0
     if not is_minimum_length or not any_potential_line_endings:
@@ -91,6 +114,21 @@ def split_sentence_word_tokenizers_jl_separator(
     return [sentences[0], "".join(sentences[1:])]
 
 
+@lru_cache(maxsize=None)
+def _on_fail_action_from_str(on_fail: str) -> Optional[OnFailAction]:
+    return OnFailAction.__members__.get(on_fail.upper())
+
+
+def _resolve_on_fail_action(on_fail: Any) -> Optional[OnFailAction]:
+    """Returns the OnFailAction named by `on_fail`, or None if it is a
+    custom handler."""
+    if isinstance(on_fail, OnFailAction):
+        return on_fail
+    if isinstance(on_fail, str):
+        return _on_fail_action_from_str(on_fail)
+    return None
+
+
 # TODO: Can we remove dataclass? It was originally added to support pydantic 1.*
 @dataclass  # type: ignore
 class Validator:
@@ -100,8 +138,8 @@ class Validator:
 
     run_in_separate_process = False
     override_value_on_pass = False
-    required_metadata_keys = []
-    _metadata = {}
+    # Immutable so the default can't be shared and appended to across subclasses
+    required_metadata_keys: ClassVar[Sequence[str]] = ()
 
     def __init__(
         self,
@@ -123,13 +161,17 @@ class Validator:
                 " Please run `guardrails configure` and try again."
             )
         self.hub_jwt_token = get_jwt_token(settings.rc)
+        # Created on first remote inference so local-only validators don't pay for it
+        self._session: Optional["requests.Session"] = None
+        self._async_client: Optional["httpx.AsyncClient"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # If use_local is not set, we can fall back to the setting determined in CLI
         if self.use_local is None:
             self.use_local = not remote_inference.get_use_remote_inference(settings.rc)
 
         if not self.validation_endpoint:
-            validator_id = self.rail_alias.split("/")[-1]
+            validator_id = self.rail_alias.rpartition("/")[2]
             submission_url = (
                 f"{VALIDATOR_HUB_SERVICE}/validator/{validator_id}/inference"
             )
@@ -140,20 +182,19 @@ class Validator:
         # first chunk is the chunk to validate
         # second chunk is incomplete chunk that needs further accumulation
         self.accumulated_chunks: List[str] = []
+        # Whether the accumulated text contains a character the default
+        # chunking function could split on; until it does, validate_stream
+        # skips joining and re-chunking the accumulated text.
+        self._may_have_chunk_boundary = False
+
+        # metadata supplied via with_metadata() for use in LCEL chains
+        self._metadata: Dict[str, Any] = {}
 
         if on_fail is None:
             on_fail = OnFailAction.EXCEPTION
-        if isinstance(on_fail, OnFailAction):
-            self.on_fail_descriptor = on_fail
-            self.on_fail_method = None
-        elif (
-            isinstance(on_fail, str)
-            and OnFailAction.__members__.get(on_fail.upper()) is not None
-        ):
-            self.on_fail_descriptor = (
-                OnFailAction.__members__.get(on_fail.upper())
-                or ""  # this default isn't needed, it's just for pyright
-            )
+        on_fail_action = _resolve_on_fail_action(on_fail)
+        if on_fail_action is not None:
+            self.on_fail_descriptor = on_fail_action
             self.on_fail_method = None
         else:
             self.on_fail_descriptor = OnFailAction.CUSTOM
@@ -178,6 +219,18 @@ class Validator:
 
         return Credentials.from_rc_file()  # type: ignore
 
+    @property
+    def _kwargs(self) -> Dict[str, Any]:
+        return self._validator_kwargs
+
+    @_kwargs.setter
+    def _kwargs(self, kwargs: Dict[str, Any]):
+        self._validator_kwargs = kwargs
+        # to_prompt() and to_xml_attrib() are derived from the kwargs,
+        # so they're computed lazily and reset whenever the kwargs are replaced.
+        self._prompt_cache: Optional[Dict[bool, str]] = None
+        self._xml_attrib_cache: Optional[str] = None
+
     def _set_on_fail_method(self, on_fail: Callable[[Any, FailResult], Any]):
         """Set the on_fail method for the validator."""
         on_fail_args = inspect.getfullargspec(on_fail)
@@ -233,6 +286,25 @@ class Validator:
         """
         raise NotImplementedError
 
+    def _inference_local_batch(self, model_inputs: List[Any]) -> List[Any]:
+        """User implementable function.
+
+        Runs a machine learning pipeline on a batch of inputs on the
+        local machine. Defaults to calling _inference_local() once per
+        input; override it if the model can process a batch at once.
+        """
+        return [self._inference_local(model_input) for model_input in model_inputs]
+
+    def _inference_remote_batch(self, model_inputs: List[Any]) -> List[Any]:
+        """User implementable function.
+
+        Runs a machine learning pipeline on a batch of inputs on a
+        remote machine. Defaults to calling _inference_remote() once per
+        input; override it to send the whole batch in a single request
+        so the round trip is paid once per batch.
+        """
+        return [self._inference_remote(model_input) for model_input in model_inputs]
+
     def validate(self, value: Any, metadata: Dict[str, Any]) -> ValidationResult:
         """Do not override this function, instead implement _validate().
 
@@ -279,6 +351,28 @@ class Validator:
             "set an validation_endpoint to perform inference in the validator."
         )
 
+    @trace(name="/validator_inference", origin="Validator._inference_batch")
+    def _inference_batch(self, model_inputs: List[Any]) -> List[Any]:
+        """Batched counterpart to _inference().
+
+        Args:
+            model_inputs (List[Any]): The inputs to be passed to your ML model.
+
+        Returns:
+            List[Any]: The outputs from the ML model inference, one per input
+                and in the same order.
+        """
+        if self.use_local:
+            return self._inference_local_batch(model_inputs)
+        if not self.use_local and self.validation_endpoint:
+            return self._inference_remote_batch(model_inputs)
+
+        raise RuntimeError(
+            "No inference endpoint set, but use_local was false. "
+            "Please set either use_local=True or "
+            "set an validation_endpoint to perform inference in the validator."
+        )
+
     def _chunking_function(self, chunk: str) -> List[str]:
         """The strategy used for chunking accumulated text input into
         validation sets.
@@ -306,21 +400,39 @@ class Validator:
         Otherwise, the validator will validate the chunk and return the
         result.
         """
-        # combine accumulated chunks and new [:-1]chunk
         self.accumulated_chunks.append(chunk)
+        remainder = kwargs.get("remainder", False)
+        # The default chunking function can only split on sentence-ending
+        # punctuation, so until one has arrived there is nothing to chunk
+        # and the pending chunks don't need to be joined.
+        uses_default_chunking = (
+            type(self)._chunking_function is Validator._chunking_function
+        )
+        if uses_default_chunking and not self._may_have_chunk_boundary:
+            self._may_have_chunk_boundary = (
+                _SENTENCE_END_CHAR_RE.search(chunk) is not None
+            )
+            if not self._may_have_chunk_boundary and not remainder:
+                return None
+
+        # combine accumulated chunks and new [:-1]chunk
         accumulated_text = "".join(self.accumulated_chunks)
         # check if enough chunks have accumulated for validation
         split_contents = self._chunking_function(accumulated_text)
 
         # if remainder kwargs is passed, validate remainder regardless
-        remainder = kwargs.get("remainder", False)
         if remainder:
             split_contents = [accumulated_text, ""]
         # if no chunks are returned, we haven't accumulated enough
         if len(split_contents) == 0:
+            # keep the joined text so it isn't re-joined on the next chunk
+            self.accumulated_chunks = [accumulated_text]
             return None
         [chunk_to_validate, new_accumulated_chunks] = split_contents
         self.accumulated_chunks = [new_accumulated_chunks]
+        self._may_have_chunk_boundary = (
+            _SENTENCE_END_CHAR_RE.search(new_accumulated_chunks) is not None
+        )
         # exclude last chunk, because it may not be a complete chunk
         validation_result = self.validate(chunk_to_validate, metadata)
         # if validate doesn't set validated chunk, we set it
@@ -347,6 +459,31 @@ class Validator:
         )
         return await loop.run_in_executor(None, validate_stream_partial)
 
+    def _hub_auth_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.hub_jwt_token}",
+            "Content-Type": "application/json",
+        }
+
+    def _get_session(self) -> "requests.Session":
+        """Returns this validator's pooled HTTP session, creating it on first
+        use so repeated inference requests reuse the same connection."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self._hub_auth_headers())
+            self._session = session
+        return self._session
+
     def _hub_inference_request(
         self, request_body: Union[dict, str], validation_endpoint: str
     ) -> Any:
@@ -366,23 +503,111 @@ class Validator:
         Returns:
             Any: Post request response from the ML based validation model.
         """
-        headers = {
-            "Authorization": f"Bearer {self.hub_jwt_token}",
-            "Content-Type": "application/json",
-        }
-        req = requests.post(validation_endpoint, data=request_body, headers=headers)
+        req = self._get_session().post(
+            validation_endpoint,
+            data=request_body,
+            timeout=HUB_INFERENCE_TIMEOUT,
+        )
         if not req.ok:
-            if req.status_code == 401:
-                raise Exception(
-                    "401: Remote Inference Unauthorized. Please run "
-                    "`guardrails configure`. You can find a new"
-                    " token at https://hub.guardrailsai.com/keys"
-                )
-            else:
-                logging.error(req.status_code)
+            self._handle_hub_inference_error(req.status_code)
+
+        return req.json()
+
+    async def _get_async_client(self) -> "httpx.AsyncClient":
+        """Returns this validator's pooled async HTTP client.
+
+        The client is bound to the event loop it was created on, so if
+        the validator is used from another loop the old client is
+        discarded and a new one is created.
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop is not loop:
+            await self._discard_async_client()
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(None, connect=HUB_INFERENCE_TIMEOUT[0]),
+                # httpx ignores the client's `limits` when given a transport
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_connections=16, max_keepalive_connections=4
+                    ),
+                ),
+                headers=self._hub_auth_headers(),
+                follow_redirects=True,
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def close(self):
+        """Closes the HTTP session used for remote inference, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self):
+        """Closes the HTTP session and async client used for remote
+        inference, if any."""
+        self.close()
+        await self._discard_async_client()
+
+    async def _discard_async_client(self):
+        client, client_loop = self._async_client, self._async_client_loop
+        self._async_client = None
+        self._async_client_loop = None
+        # A client's pooled connections belong to the loop it was created
+        # on; once that loop is closed they can't be closed from another
+        # loop, so the client is just dropped.
+        if client is None or client_loop is None or client_loop.is_closed():
+            return
+        if client_loop.is_running() and client_loop is not asyncio.get_running_loop():
+            asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+        else:
+            await client.aclose()
+
+    async def _async_hub_inference_request(
+        self, request_body: Union[dict, str], validation_endpoint: str
+    ) -> Any:
+        """Async counterpart to _hub_inference_request().
+
+        Lets validators that override async_validate() await remote
+        inference instead of blocking an executor thread on it.
+
+        Args:
+            request_body (dict): A dictionary containing the required info for the final
+            validation_endpoint (str): The url to request as an endpoint
+            inference endpoint to run.
+
+        Raises:
+            HttpError: If the recieved reply was not ok.
+
+        Returns:
+            Any: Post request response from the ML based validation model.
+        """
+        client = await self._get_async_client()
+        req = await client.post(
+            validation_endpoint,
+            # mirror requests' `data=` semantics used by the sync path
+            content=request_body if isinstance(request_body, str) else None,
+            data=request_body if isinstance(request_body, dict) else None,
+        )
+        if not req.is_success:
+            self._handle_hub_inference_error(req.status_code)
 
         return req.json()
 
+    def _handle_hub_inference_error(self, status_code: int):
+        if status_code == 401:
+            raise Exception(
+                "401: Remote Inference Unauthorized. Please run "
+                "`guardrails configure`. You can find a new"
+                " token at https://hub.guardrailsai.com/keys"
+            )
+        else:
+            logging.error(status_code)
+
     def to_prompt(self, with_keywords: bool = True) -> str:
         """Convert the validator to a prompt.
 
@@ -395,35 +620,54 @@ class Validator:
         Returns:
             A string representation of the validator.
         """
-        if not len(self._kwargs):
+        if self._prompt_cache is None:
+            self._prompt_cache = {}
+        prompt = self._prompt_cache.get(with_keywords)
+        if prompt is None:
+            prompt = self._compute_prompt(with_keywords)
+            self._prompt_cache[with_keywords] = prompt
+        return prompt
+
+    def _compute_prompt(self, with_keywords: bool) -> str:
+        if not self._kwargs:
             return self.rail_alias
 
-        kwargs = self._kwargs.copy()
-        for k, v in kwargs.items():
-            if not isinstance(v, str):
-                kwargs[k] = str(v)
-
-        params = " ".join(list(kwargs.values()))
         if with_keywords:
-            params = " ".join([f"{k}={v}" for k, v in kwargs.items()])
+            params = " ".join(f"{k}={v!s}" for k, v in self._kwargs.items())
+        else:
+            params = " ".join(str(v) for v in self._kwargs.values())
         return f"{self.rail_alias}: {params}"
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _xml_attrib_arg_names(cls) -> Tuple[str, ...]:
+        """The __init__ arguments serialized by to_xml_attrib(), computed once
+        per class."""
+        init_args = inspect.getfullargspec(cls.__init__)
+        return tuple(
+            arg
+            for arg in init_args.args[1:]
+            if arg not in ("on_fail", "args", "kwargs")
+        )
+
     # TODO: Is this still used anywhere?
     def to_xml_attrib(self):
         """Convert the validator to an XML attribute."""
+        if self._xml_attrib_cache is None:
+            self._xml_attrib_cache = self._compute_xml_attrib()
+        return self._xml_attrib_cache
 
-        if not len(self._kwargs):
+    def _compute_xml_attrib(self) -> str:
+        if not self._kwargs:
             return self.rail_alias
 
         validator_args = []
-        init_args = inspect.getfullargspec(self.__init__)
-        for arg in init_args.args[1:]:
-            if arg not in ("on_fail", "args", "kwargs"):
-                arg_value = self._kwargs.get(arg)
-                str_arg = str(arg_value)
-                if str_arg is not None:
-                    str_arg = "{" + str_arg + "}" if " " in str_arg else str_arg
-                    validator_args.append(str_arg)
+        for arg in type(self)._xml_attrib_arg_names():
+            arg_value = self._kwargs.get(arg)
+            str_arg = str(arg_value)
+            if str_arg is not None:
+                str_arg = "{" + str_arg + "}" if " " in str_arg else str_arg
+                validator_args.append(str_arg)
 
         params = " ".join(validator_args)
         return f"{self.rail_alias}: {params}"
@@ -448,30 +692,28 @@ class Validator:
             return False
         return self.to_prompt() == other.to_prompt()
 
+    def __hash__(self):
+        """Hashes the validator by its prompt.
+
+        The prompt is cached until `_kwargs` is reassigned, so `_kwargs`
+        must not be mutated in place; doing so leaves a stale prompt
+        behind for both __hash__ and __eq__.
+        """
+        return hash(self.to_prompt())
+
     # TODO: Make this a generic method on an abstract class
     def __stringify__(self):
-        template = Template(
-            """
-            ${class_name} {
-                rail_alias: ${rail_alias},
-                on_fail: ${on_fail_descriptor},
-                run_in_separate_process: ${run_in_separate_process},
-                override_value_on_pass: ${override_value_on_pass},
-                required_metadata_keys: ${required_metadata_keys},
-                kwargs: ${kwargs}
-            }"""
-        )
-        return template.safe_substitute(
-            {
-                "class_name": self.__class__.__name__,
-                "rail_alias": self.rail_alias,
-                "on_fail_descriptor": self.on_fail_descriptor,
-                "run_in_separate_process": self.run_in_separate_process,
-                "override_value_on_pass": self.override_value_on_pass,
-                "required_metadata_keys": self.required_metadata_keys,
-                "kwargs": self._kwargs,
-            }
-        )
+        # !s matches string.Template's str() conversion; plain f-string
+        # formatting renders str-mixin enums differently on Python < 3.12.
+        return f"""
+            {self.__class__.__name__!s} {{
+                rail_alias: {self.rail_alias!s},
+                on_fail: {self.on_fail_descriptor!s},
+                run_in_separate_process: {self.run_in_separate_process!s},
+                override_value_on_pass: {self.override_value_on_pass!s},
+                required_metadata_keys: {self.required_metadata_keys!s},
+                kwargs: {self._kwargs!s}
+            }}"""
 
     """
     This method allows the user to provide metadata to validators used in an LCEL chain.
@@ -496,7 +738,7 @@ class Validator:
         self._metadata = metadata
         return self
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         from guardrails.integrations.langchain.validator_runnable import (
             ValidatorRunnable,
         )
@@ -564,6 +806,9 @@ def register_validator(
     return decorator
 
 
+# Only attempt the import once; a failed import is expensive and would
+# otherwise be retried for every unregistered validator lookup.
+@lru_cache(maxsize=None)
 def try_to_import_hub():
     try:
         # This should import everything and trigger registration
@@ -574,13 +819,21 @@ def try_to_import_hub():
         logger.error("Could not import hub. Validators may not work properly.")
 
 
+@lru_cache(maxsize=256)
+def _get_validator_key(name: str) -> str:
+    """Strips the hub prefix, if any, from a validator id."""
+    is_hub_validator = name.startswith(hub)
+    return name.replace(hub, "") if is_hub_validator else name
+
+
 # TODO: Move this to validator_utils.py
 def get_validator_class(name: Optional[str]) -> Optional[Type[Validator]]:
     if not name:
         return None
-    is_hub_validator = name.startswith(hub)
-    validator_key = name.replace(hub, "") if is_hub_validator else name
+    validator_key = _get_validator_key(name)
 
+    # The registry itself is not cached since validators can be
+    # registered (or re-registered) at any point.
     registration = validators_registry.get(validator_key)
     if not registration:
         try_to_import_hub()
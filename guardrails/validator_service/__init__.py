@@ -3,13 +3,14 @@ import os
 from typing import Any, Iterator, Optional, Tuple
 import warnings
 
-from guardrails.actions.filter import apply_filters
-from guardrails.actions.refrain import apply_refrain
+from guardrails.actions.filter import filter_and_check_refrain
+from guardrails.actions.refrain import get_refrain_value
 from guardrails.classes.history import Iteration
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.validation.validation_result import (
     StreamValidationResult,
 )
+from guardrails.logger import logger
 from guardrails.types import ValidatorMap
 from guardrails.telemetry.legacy_validator_tracing import trace_validation_result
 
@@ -142,10 +143,12 @@ def post_process_validation(
     iteration: Iteration,
     output_type: OutputTypes,
 ) -> Any:
-    validated_response = apply_refrain(validation_response, output_type)
-
-    # Remove all keys that have `Filter` values.
-    validated_response = apply_filters(validated_response)
+    # Remove all keys that have `Filter` values,
+    # checking for `Refrain` values in the same pass.
+    found_refrain, validated_response = filter_and_check_refrain(validation_response)
+    if found_refrain:
+        logger.debug("Refrain detected.")
+        validated_response = get_refrain_value(output_type)
 
     trace_validation_result(
         validation_logs=iteration.validator_logs, attempt_number=attempt_number
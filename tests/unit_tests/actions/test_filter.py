@@ -1,6 +1,7 @@
 import pytest
 
-from guardrails.actions.filter import Filter, apply_filters
+from guardrails.actions.filter import Filter, apply_filters, filter_and_check_refrain
+from guardrails.actions.refrain import Refrain
 
 
 @pytest.mark.parametrize(
@@ -15,7 +16,48 @@ from guardrails.actions.filter import Filter, apply_filters
         ({"a": "b", "c": {"d": Filter()}}, {"a": "b", "c": {}}),
         ({"a": "b", "c": {"d": "e"}}, {"a": "b", "c": {"d": "e"}}),
         ({"a": "b", "c": ["d", Filter()]}, {"a": "b", "c": ["d"]}),
+        (
+            ["a", None, {"b": None, "c": [Filter(), {"d": "e"}]}],
+            ["a", {"c": [{"d": "e"}]}],
+        ),
+        (Filter(), None),
+        ("a", "a"),
     ],
 )
 def test_apply_filters(value, expected):
     assert apply_filters(value) == expected
+
+
+def test_apply_filters_deeply_nested():
+    depth = 5000
+    value = ["leaf", Filter()]
+    for _ in range(depth):
+        value = [value, Filter()]
+
+    filtered = apply_filters(value)
+
+    # Walk the result iteratively; comparing with == would itself recurse
+    for _ in range(depth):
+        assert len(filtered) == 1
+        filtered = filtered[0]
+    assert filtered == ["leaf"]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (["a", Filter(), "b"], (False, ["a", "b"])),
+        ({"a": Filter(), "b": {"c": "d"}}, (False, {"b": {"c": "d"}})),
+        (["a", Filter(), Refrain()], (True, None)),
+        ({"a": "b", "c": [Filter(), {"d": Refrain()}]}, (True, None)),
+        (Refrain(), (True, None)),
+        (Filter(), (False, None)),
+    ],
+)
+def test_filter_and_check_refrain(value, expected):
+    assert filter_and_check_refrain(value) == expected
+
+
+def test_apply_filters_keeps_refrain():
+    refrain = Refrain()
+    assert apply_filters(["a", Filter(), refrain]) == ["a", refrain]
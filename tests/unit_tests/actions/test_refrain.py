@@ -25,6 +25,14 @@ def test_check_for_refrain(value, expected):
     assert check_for_refrain(value) == expected
 
 
+def test_check_for_refrain_deeply_nested():
+    value = [Refrain()]
+    for _ in range(5000):
+        value = {"a": [value]}
+
+    assert check_for_refrain(value) is True
+
+
 @pytest.mark.parametrize(
     "value,output_type,expected",
     [
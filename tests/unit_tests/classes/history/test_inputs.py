@@ -57,3 +57,33 @@ def test_non_empty_initialization():
     assert inputs.metadata == metadata
     assert inputs.full_schema_reask is not None
     assert inputs.full_schema_reask == full_schema_reask
+
+
+def test_construct_trusted():
+    messages = [{"role": "user", "content": "Respond with a greeting."}]
+    metadata = {"some_meta_data": "doesn't actually matter"}
+
+    inputs = Inputs.construct_trusted(
+        llm_output="Hello there!",
+        messages=messages,
+        num_reasks=0,
+        metadata=metadata,
+    )
+
+    assert inputs == Inputs(
+        llm_output="Hello there!",
+        messages=messages,
+        num_reasks=0,
+        metadata=metadata,
+    )
+    # mutable inputs are copied so the history can't change after the fact
+    assert inputs.metadata is not metadata
+    assert inputs.messages[0] is not messages[0]
+    assert inputs.stream is False
+    assert inputs.to_dict() == {
+        "llmOutput": "Hello there!",
+        "messages": messages,
+        "numReasks": 0,
+        "metadata": metadata,
+        "stream": False,
+    }
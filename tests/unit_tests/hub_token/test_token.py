@@ -0,0 +1,60 @@
+import datetime
+from datetime import timezone
+
+import jwt
+import pytest
+
+from guardrails.classes.rc import RC
+from guardrails.hub_token.token import (
+    TOKEN_EXPIRED_MESSAGE,
+    TOKEN_INVALID_MESSAGE,
+    ExpiredTokenError,
+    InvalidTokenError,
+    get_jwt_token,
+)
+
+
+def encode_token(expires_in: datetime.timedelta) -> str:
+    expiration = datetime.datetime.now(timezone.utc) + expires_in
+    return jwt.encode({"exp": expiration}, "secret", algorithm="HS256")
+
+
+def test_get_jwt_token():
+    valid_jwt = encode_token(datetime.timedelta(seconds=1000))
+    rc = RC.from_dict({"token": valid_jwt})
+
+    assert get_jwt_token(rc) == valid_jwt
+    # Repeated lookups of the same token return the same result
+    assert get_jwt_token(rc) == valid_jwt
+
+
+def test_get_jwt_token_expired():
+    expired_jwt = encode_token(datetime.timedelta(seconds=-1000))
+
+    with pytest.raises(ExpiredTokenError) as e:
+        get_jwt_token(RC.from_dict({"token": expired_jwt}))
+
+    assert str(e.value) == TOKEN_EXPIRED_MESSAGE
+
+
+def test_get_jwt_token_expires_after_first_check(mocker):
+    valid_jwt = encode_token(datetime.timedelta(seconds=1000))
+    rc = RC.from_dict({"token": valid_jwt})
+    assert get_jwt_token(rc) == valid_jwt
+
+    now = datetime.datetime.now(timezone.utc) + datetime.timedelta(seconds=2000)
+    mocker.patch("guardrails.hub_token.token.time.time", return_value=now.timestamp())
+
+    with pytest.raises(ExpiredTokenError):
+        get_jwt_token(rc)
+
+
+def test_get_jwt_token_invalid():
+    with pytest.raises(InvalidTokenError) as e:
+        get_jwt_token(RC.from_dict({"token": "invalid"}))
+
+    assert str(e.value) == TOKEN_INVALID_MESSAGE
+
+
+def test_get_jwt_token_without_token():
+    assert get_jwt_token(RC.from_dict({})) is None
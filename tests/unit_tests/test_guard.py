@@ -34,6 +34,12 @@ class RequiringValidator2(Validator):
         return PassResult()
 
 
+@register_validator("mymetadataaddingvalidator", data_type="string")
+class MetadataAddingValidator(Validator):
+    def validate(self, value, metadata):
+        return PassResult(metadata={**metadata, "added": True})
+
+
 @pytest.mark.parametrize(
     "spec,metadata,error_message",
     [
@@ -483,6 +489,17 @@ def test_use_many_tuple():
 
 
 # TODO: Move to integration tests; these are not unit tests...
+def test_history_inputs_metadata_unaffected_by_validator_metadata(monkeypatch):
+    # the sequential validator service passes validator metadata back
+    monkeypatch.setenv("GUARDRAILS_RUN_SYNC", "true")
+    guard = Guard().use(MetadataAddingValidator)
+    metadata = {"user": 1}
+
+    guard.parse("hello", metadata=metadata)
+
+    assert guard.history.last.iterations.last.inputs.metadata == {"user": 1}
+
+
 class TestValidate:
     def test_output_only_success(self):
         guard: Guard = (
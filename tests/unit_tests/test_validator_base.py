@@ -1,5 +1,8 @@
+import asyncio
+import http.server
 import json
 import re
+import threading
 from typing import Any, Dict, List
 import pytest
 from pydantic import BaseModel, Field
@@ -16,6 +19,7 @@ from guardrails.classes.validation.validation_result import (
     ValidationResult,
 )
 from guardrails.types import OnFailAction
+from guardrails.validator_base import split_sentence_str
 from tests.integration_tests.test_assets.validators import (
     TwoWords,
     ValidLength,
@@ -206,6 +210,175 @@ def test_to_xml_attrib(min, max, expected_xml):
     assert xml_validator == expected_xml
 
 
+@pytest.mark.parametrize(
+    "chunk,expected",
+    [
+        ("no period here", []),
+        ("One.", ["One.", ""]),
+        ("One. Two. Three", ["One.", " Two. Three"]),
+        ("...", [".", ".."]),
+    ],
+)
+def test_split_sentence_str(chunk, expected):
+    assert split_sentence_str(chunk) == expected
+
+
+def test_validate_stream_accumulates_until_sentence_boundary():
+    validator = ValidLength(min=1, max=100)
+
+    assert validator.validate_stream("Hello there", {}) is None
+    assert validator.validate_stream(" friend", {}) is None
+    # no sentence-ending punctuation yet, so the chunks aren't joined
+    assert validator.accumulated_chunks == ["Hello there", " friend"]
+
+    result = validator.validate_stream(". How", {})
+    assert isinstance(result, PassResult)
+    assert result.validated_chunk == "Hello there friend."
+    assert validator.accumulated_chunks == ["How"]
+
+    assert validator.validate_stream(" are you", {}) is None
+    validator.accumulated_chunks.append(" today")
+    result = validator.validate_stream("", {}, remainder=True)
+    assert result.validated_chunk == "How are you today"
+    assert validator.accumulated_chunks == [""]
+
+
+@register_validator("mycustombatchvalidator", data_type="string")
+class BatchValidator(Validator):
+    def _inference_local(self, model_input: Any) -> Any:
+        return f"local:{model_input}"
+
+    def _inference_remote(self, model_input: Any) -> Any:
+        return f"remote:{model_input}"
+
+
+@pytest.mark.parametrize(
+    "use_local,expected",
+    [
+        (True, ["local:a", "local:b"]),
+        (False, ["remote:a", "remote:b"]),
+    ],
+)
+def test_inference_batch_defaults_to_per_input_calls(use_local, expected):
+    validator = BatchValidator(use_local=use_local)
+    assert validator._inference_batch(["a", "b"]) == expected
+
+
+def test_validator_hash_and_eq():
+    first = ValidLength(min=1, max=10)
+    second = ValidLength(min=1, max=10)
+    third = ValidLength(min=1, max=12)
+
+    assert first == second
+    assert first != third
+    assert len({first, second, third}) == 2
+
+
+def test_to_prompt_cache_resets_with_kwargs():
+    validator = ValidLength(min=1, max=10)
+    assert validator.to_prompt() == "length: min=1 max=10"
+    assert validator.to_prompt(with_keywords=False) == "length: 1 10"
+
+    validator._kwargs = {"min": 2, "max": 5}
+
+    assert validator.to_prompt() == "length: min=2 max=5"
+    assert validator.to_xml_attrib() == "length: 2 5"
+
+
+def test_with_metadata_is_per_instance():
+    first = ValidLength(min=1, max=10)
+    second = ValidLength(min=1, max=10)
+
+    first.with_metadata({"key": "value"})
+
+    assert first._metadata == {"key": "value"}
+    assert second._metadata == {}
+    assert "_metadata" not in vars(Validator)
+
+
+def test_hub_inference_request_reuses_session(mocker):
+    validator = ValidLength(min=1, max=10)
+    mock_response = mocker.MagicMock(ok=True)
+    mock_response.json.return_value = {"result": True}
+    mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
+
+    for _ in range(2):
+        response = validator._hub_inference_request("{}", "https://example.com")
+        assert response == {"result": True}
+
+    assert mock_post.call_count == 2
+    assert validator._get_session() is validator._get_session()
+    headers = validator._get_session().headers
+    assert headers["Authorization"] == f"Bearer {validator.hub_jwt_token}"
+
+
+@pytest.mark.asyncio
+async def test_async_hub_inference_request(mocker):
+    validator = ValidLength(min=1, max=10)
+    mock_response = mocker.MagicMock(is_success=True)
+    mock_response.json.return_value = {"result": True}
+    mock_post = mocker.patch("httpx.AsyncClient.post", new_callable=mocker.AsyncMock)
+    mock_post.return_value = mock_response
+
+    response = await validator._async_hub_inference_request("{}", "https://example.com")
+
+    assert response == {"result": True}
+    mock_post.assert_awaited_once()
+    assert mock_post.call_args.kwargs["content"] == "{}"
+    client = await validator._get_async_client()
+    assert client is await validator._get_async_client()
+    assert client.headers["Authorization"] == f"Bearer {validator.hub_jwt_token}"
+
+    await validator.aclose()
+    assert client.is_closed
+    assert validator._async_client is None
+
+
+@pytest.fixture
+def keep_alive_server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'{"result": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_hub_inference_request_across_event_loops(keep_alive_server):
+    validator = ValidLength(min=1, max=10)
+
+    clients = []
+    for _ in range(3):
+        response = asyncio.run(
+            validator._async_hub_inference_request("{}", keep_alive_server)
+        )
+        assert response == {"result": True}
+        clients.append(validator._async_client)
+
+    # each loop gets its own client; ones from closed loops are dropped
+    assert len(set(map(id, clients))) == 3
+    pool = validator._async_client._transport._pool
+    assert pool._max_connections == 16
+    assert pool._max_keepalive_connections == 4
+    asyncio.run(validator.aclose())
+    assert validator._async_client is None
+
+
 def custom_deprecated_on_fail_handler(value: Any, fail_results: List[FailResult]):
     return value + " deprecated"
 